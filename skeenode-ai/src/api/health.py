@@ -2,12 +2,14 @@
 API Routes for Health Checks and Model Management
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from ..config import settings
 from ..model_registry import ModelRegistry, get_registry
@@ -22,8 +24,26 @@ from ..schemas import (
 
 logger = logging.getLogger(__name__)
 
-# Track service start time
-_start_time = time.time()
+# Track service start time (monotonic: immune to wallclock jumps)
+_start_time_ns = time.monotonic_ns()
+
+# Shared dependency alias so FastAPI caches signature introspection once
+RegistryDep = Annotated[ModelRegistry, Depends(get_registry)]
+
+# Cached Redis ping so probe bursts don't each pay a round-trip:
+# (checked_at_monotonic, status, latency_ms, message)
+_PING_TTL_SECONDS = 1.0
+_last_ping: tuple[float, HealthStatus, Optional[float], Optional[str]] = (
+    0.0, HealthStatus.UNHEALTHY, None, None,
+)
+
+# Pre-serialized /health body reused while fresh: (expiry_monotonic, bytes)
+_HEALTH_TTL_SECONDS = 1.0
+_cached_health: tuple[float, bytes] = (0.0, b"")
+
+# Constant probe responses: skip per-probe dict serialization entirely
+_LIVE_RESPONSE = Response(content=b'{"status":"alive"}', media_type="application/json")
+_READY_RESPONSE = Response(content=b'{"status":"ready"}', media_type="application/json")
 
 router = APIRouter(tags=["Health & Management"])
 
@@ -35,64 +55,90 @@ router = APIRouter(tags=["Health & Management"])
     description="Check service health and dependencies",
 )
 async def health_check(
-    registry: ModelRegistry = Depends(get_registry),
-) -> HealthResponse:
+    registry: RegistryDep,
+) -> Response:
     """Comprehensive health check with dependency status"""
-    
+    global _last_ping, _cached_health
+
+    # Serve the pre-serialized body while fresh (probe bursts hit this)
+    expiry, body = _cached_health
+    if time.monotonic() < expiry:
+        return Response(content=body, media_type="application/json")
+
     dependencies = []
     overall_status = HealthStatus.HEALTHY
-    
-    # Check Redis
-    try:
-        start = time.time()
-        registry.redis.ping()
-        latency = (time.time() - start) * 1000
-        dependencies.append(DependencyHealth(
-            name="redis",
-            status=HealthStatus.HEALTHY,
-            latency_ms=latency,
-        ))
-    except Exception as e:
-        dependencies.append(DependencyHealth(
-            name="redis",
-            status=HealthStatus.UNHEALTHY,
-            message=str(e),
-        ))
+    loop = asyncio.get_running_loop()
+
+    def _ping_redis() -> tuple[HealthStatus, Optional[float], Optional[str]]:
+        try:
+            start_ns = time.monotonic_ns()
+            registry.redis.ping()
+            return HealthStatus.HEALTHY, (time.monotonic_ns() - start_ns) / 1e6, None
+        except Exception as e:
+            return HealthStatus.UNHEALTHY, None, str(e)
+
+    async def _check_redis() -> tuple[HealthStatus, Optional[float], Optional[str]]:
+        global _last_ping
+        # At most one real ping per TTL window
+        checked_at, status, latency, message = _last_ping
+        if time.monotonic() - checked_at >= _PING_TTL_SECONDS:
+            status, latency, message = await loop.run_in_executor(None, _ping_redis)
+            _last_ping = (time.monotonic(), status, latency, message)
+        return status, latency, message
+
+    async def _check_model():
+        return await loop.run_in_executor(None, registry.get_model_for_prediction)
+
+    # Run the independent sub-checks concurrently: wall-time is the max
+    # of the two latencies instead of their sum
+    (redis_status, redis_latency, redis_message), model_result = await asyncio.gather(
+        _check_redis(), _check_model()
+    )
+
+    dependencies.append(DependencyHealth(
+        name="redis",
+        status=redis_status,
+        latency_ms=redis_latency,
+        message=redis_message,
+    ))
+    if redis_status != HealthStatus.HEALTHY:
         overall_status = HealthStatus.DEGRADED
-    
-    # Check model
-    model_result = registry.get_model_for_prediction()
+
     model_loaded = model_result is not None
     active_version = model_result[0] if model_result else None
-    
+
     if not model_loaded:
         overall_status = HealthStatus.DEGRADED
     
-    return HealthResponse(
+    response = HealthResponse(
         status=overall_status,
         version=settings.service_name,
-        uptime_seconds=time.time() - _start_time,
+        uptime_seconds=(time.monotonic_ns() - _start_time_ns) / 1e9,
         dependencies=dependencies,
         model_loaded=model_loaded,
         active_model_version=active_version,
     )
 
+    body = orjson.dumps(response.model_dump())
+    _cached_health = (time.monotonic() + _HEALTH_TTL_SECONDS, body)
+    return Response(content=body, media_type="application/json")
+
 
 @router.get("/ready")
 async def readiness_check(
-    registry: ModelRegistry = Depends(get_registry),
+    registry: RegistryDep,
 ):
     """Kubernetes readiness probe"""
     model = registry.get_model_for_prediction()
     if model is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
-    return {"status": "ready"}
+    return _READY_RESPONSE
 
 
 @router.get("/live")
 async def liveness_check():
     """Kubernetes liveness probe"""
-    return {"status": "alive"}
+    return _LIVE_RESPONSE
 
 
 # ============================================
@@ -108,17 +154,19 @@ model_router = APIRouter(prefix="/models", tags=["Model Management"])
     summary="List registered models",
 )
 async def list_models(
-    registry: ModelRegistry = Depends(get_registry),
+    registry: RegistryDep,
 ) -> ModelListResponse:
     """List all registered model versions"""
     versions = registry.list_versions()
     active_version = None
-    
+
+    # Registry metadata is already trusted/typed, so model_construct skips
+    # pydantic's per-field validation chain on every version
     models = []
     for v in versions:
         if v.is_active and v.traffic_weight > 0:
             active_version = v.version_id
-        models.append(ModelInfo(
+        models.append(ModelInfo.model_construct(
             version_id=v.version_id,
             model_type=v.model_type,
             created_at=datetime.fromtimestamp(v.created_at),
@@ -127,7 +175,7 @@ async def list_models(
             metrics=v.metrics,
             features=v.features,
         ))
-    
+
     return ModelListResponse(models=models, active_version=active_version)
 
 
@@ -137,7 +185,7 @@ async def list_models(
 )
 async def activate_model(
     request: ActivateModelRequest,
-    registry: ModelRegistry = Depends(get_registry),
+    registry: RegistryDep,
 ):
     """Activate a specific model version for traffic"""
     try:
@@ -153,7 +201,7 @@ async def activate_model(
 )
 async def rollback_model(
     version_id: str,
-    registry: ModelRegistry = Depends(get_registry),
+    registry: RegistryDep,
 ):
     """Rollback to a previous model version"""
     try:
@@ -169,7 +217,7 @@ async def rollback_model(
 )
 async def delete_model(
     version_id: str,
-    registry: ModelRegistry = Depends(get_registry),
+    registry: RegistryDep,
 ):
     """Delete a non-active model version"""
     try:
@@ -5,16 +5,19 @@ Endpoints for triggering model training and checking status.
 Uses Redis for training status to support distributed deployments.
 """
 
-import json
 import logging
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Annotated, Optional
 
-import redis
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+import orjson
+import redis.asyncio as aioredis
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ..config import settings
 from ..data.training import TrainingConfig, TrainingPipeline, TrainingResult
+from ..redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +31,17 @@ class TrainingStatusStore:
     STATUS_KEY = "skeenode:training:status"
     RESULT_KEY = "skeenode:training:result"
     LOCK_KEY = "skeenode:training:lock"
+    EVENTS_CHANNEL = "skeenode:training:events"
     LOCK_TTL = 3600  # 1 hour max training time
     
     def __init__(self, redis_url: str = None):
-        url = redis_url or settings.redis_url
-        self.redis = redis.from_url(url)
+        self.redis = get_redis_client(redis_url)
     
     def is_running(self) -> bool:
         """Check if training is currently running"""
-        return self.redis.exists(self.LOCK_KEY)
+        # EXISTS returns an int; coerce so pushed event payloads
+        # serialize the same JSON bool as the snapshot frame
+        return bool(self.redis.exists(self.LOCK_KEY))
     
     def acquire_lock(self) -> bool:
         """Try to acquire training lock"""
@@ -45,18 +50,35 @@ class TrainingStatusStore:
     def release_lock(self):
         """Release training lock"""
         self.redis.delete(self.LOCK_KEY)
-    
+        self._publish({"running": False})
+
     def set_result(self, result: dict):
         """Store training result"""
-        self.redis.set(self.RESULT_KEY, json.dumps(result))
+        self.redis.set(self.RESULT_KEY, orjson.dumps(result))
+        self._publish({"running": self.is_running(), "last_result": result})
+
+    def _publish(self, event: dict):
+        """Push a status event to stream subscribers (best-effort)"""
+        try:
+            self.redis.publish(self.EVENTS_CHANNEL, orjson.dumps(event))
+        except Exception as e:
+            logger.warning(f"Failed to publish training event: {e}")
     
     def get_result(self) -> Optional[dict]:
         """Get last training result"""
         data = self.redis.get(self.RESULT_KEY)
         if data:
-            return json.loads(data)
+            return orjson.loads(data)
         return None
 
+    def get_status_and_result(self) -> tuple[bool, Optional[dict]]:
+        """Fetch running state and last result in one pipelined round-trip"""
+        pipe = self.redis.pipeline()
+        pipe.exists(self.LOCK_KEY)
+        pipe.get(self.RESULT_KEY)
+        running, data = pipe.execute()
+        return bool(running), orjson.loads(data) if data else None
+
 
 # Global status store
 _status_store: Optional[TrainingStatusStore] = None
@@ -70,6 +92,38 @@ def get_status_store() -> TrainingStatusStore:
     return _status_store
 
 
+def init_status_store(redis_url: str = None) -> TrainingStatusStore:
+    """Initialize the global status store at startup with a warm connection.
+
+    Pre-pinging establishes the TCP connection so the first /training/*
+    request doesn't pay the connection setup on its critical path.
+    """
+    global _status_store
+    _status_store = TrainingStatusStore(redis_url)
+    try:
+        _status_store.redis.ping()
+    except Exception as e:
+        logger.warning(f"Training status store Redis unavailable: {e}")
+    return _status_store
+
+
+# Shared dependency alias so FastAPI caches signature introspection once
+StatusStoreDep = Annotated[TrainingStatusStore, Depends(get_status_store)]
+
+
+# Dedicated single-worker process pool: the CPU-heavy XGBoost fit would
+# otherwise hold this API worker's GIL/event loop for the whole run
+_training_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_training_executor() -> ProcessPoolExecutor:
+    """Get or create the training process pool"""
+    global _training_executor
+    if _training_executor is None:
+        _training_executor = ProcessPoolExecutor(max_workers=1)
+    return _training_executor
+
+
 class TrainingRequest(BaseModel):
     """Request to trigger training"""
     database_url: str = Field(description="PostgreSQL connection string")
@@ -91,8 +145,7 @@ class TrainingStatusResponse(BaseModel):
 )
 async def start_training(
     request: TrainingRequest,
-    background_tasks: BackgroundTasks,
-    status_store: TrainingStatusStore = Depends(get_status_store),
+    status_store: StatusStoreDep,
 ):
     """
     Start training in background. Training collects data from PostgreSQL,
@@ -103,23 +156,23 @@ async def start_training(
             status_code=409,
             detail="Training already in progress",
         )
-    
+
     if not status_store.acquire_lock():
         raise HTTPException(
             status_code=409,
             detail="Failed to acquire training lock",
         )
-    
-    # Run training in background
-    background_tasks.add_task(
-        _run_training_task,
+
+    # Run training in the dedicated process so this worker keeps serving
+    get_training_executor().submit(
+        _run_training_job,
         request.database_url,
         request.lookback_days,
         request.activate_on_success,
         request.min_accuracy,
-        status_store,
+        settings.redis_url,
     )
-    
+
     return {"status": "started", "message": "Training started in background"}
 
 
@@ -129,23 +182,56 @@ async def start_training(
     summary="Get training status",
 )
 async def get_training_status(
-    status_store: TrainingStatusStore = Depends(get_status_store),
+    status_store: StatusStoreDep,
 ):
     """Get current training status and last result"""
-    return TrainingStatusResponse(
-        running=status_store.is_running(),
-        last_result=status_store.get_result(),
-    )
+    running, result = status_store.get_status_and_result()
+    return TrainingStatusResponse(running=running, last_result=result)
+
+
+@router.get(
+    "/status/stream",
+    summary="Stream training status updates",
+    description="Server-sent events stream pushed via Redis pub/sub",
+)
+async def stream_training_status(
+    status_store: StatusStoreDep,
+):
+    """
+    Push-based alternative to polling /training/status. Emits the current
+    state immediately, then an SSE frame per training event.
+    """
+
+    async def event_stream():
+        client = aioredis.from_url(settings.redis_url)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(TrainingStatusStore.EVENTS_CHANNEL)
+        try:
+            # Current state first so subscribers don't wait for the next event
+            running, result = status_store.get_status_and_result()
+            snapshot = {"running": running, "last_result": result}
+            yield b"data: " + orjson.dumps(snapshot) + b"\n\n"
+
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                yield b"data: " + message["data"] + b"\n\n"
+        finally:
+            await pubsub.unsubscribe(TrainingStatusStore.EVENTS_CHANNEL)
+            await client.aclose()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
-async def _run_training_task(
+def _run_training_job(
     database_url: str,
     lookback_days: int,
     activate: bool,
     min_accuracy: float,
-    status_store: TrainingStatusStore,
+    redis_url: str = None,
 ):
-    """Background training task"""
+    """Training job body; runs inside the dedicated training process"""
+    status_store = TrainingStatusStore(redis_url)
     try:
         config = TrainingConfig(
             database_url=database_url,
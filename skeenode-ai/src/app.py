@@ -7,24 +7,29 @@ route organization, and error handling.
 
 import logging
 import os
+
+# Avoid OpenMP thread oversubscription during inference: uvicorn already
+# parallelizes across workers, so keep XGBoost single-threaded per process.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import numpy as np
-import pandas as pd
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from xgboost import XGBClassifier
 
 from .api.health import model_router, router as health_router
 from .api.predictions import router as prediction_router
-from .api.training import router as training_router
+from .api.training import init_status_store, router as training_router
 from .config import settings
 from .middleware.logging import RequestLoggingMiddleware, setup_logging
 from .middleware.rate_limit import RateLimitMiddleware
 from .model_registry import init_registry
+from .services.prediction import get_batcher
 
 # Setup logging first
 setup_logging()
@@ -43,60 +48,90 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
             models_dir=settings.model_path,
         )
         
-        # Check if we have any models, if not train a bootstrap model
+        # Check if we have any models, if not train a bootstrap model.
+        # SETNX lock so only one worker pays the fit on first deploy;
+        # the others pick up the registered model via registry reload.
         if not registry.list_versions():
-            logger.info("No models found, training bootstrap model...")
-            model = train_bootstrap_model()
-            registry.register_model(
-                model=model,
-                metrics={"bootstrap": True, "accuracy": 0.0},
-                features=[
-                    "day_of_week",
-                    "hour",
-                    "job_type_len",
-                    "execution_count",
-                    "avg_duration_ms",
-                    "failure_rate",
-                ],
-                model_type="xgboost",
-                activate=True,
-            )
-            logger.info("Bootstrap model registered and activated")
+            if registry.redis.set("skeenode:bootstrap:lock", "1", nx=True, ex=300):
+                logger.info("No models found, training bootstrap model...")
+                model = train_bootstrap_model()
+                registry.register_model(
+                    model=model,
+                    metrics={"bootstrap": True, "accuracy": 0.0},
+                    features=BOOTSTRAP_FEATURES,
+                    model_type="xgboost",
+                    activate=True,
+                )
+                logger.info("Bootstrap model registered and activated")
+            else:
+                logger.info("Bootstrap training held by another worker, skipping")
         else:
             logger.info(f"Found {len(registry.list_versions())} registered model(s)")
     
     except Exception as e:
         logger.warning(f"Failed to initialize model registry: {e}")
         logger.warning("Service starting in degraded mode")
-    
+
+    # Warm the training status store so the first request skips connection setup
+    init_status_store(settings.redis_url)
+
+    # Pre-build the OpenAPI schema: generating it lazily costs >100ms on the
+    # first request that would otherwise compete with real traffic
+    app.openapi()
+
+    # Start the micro-batching worker if enabled
+    batcher = None
+    if settings.micro_batching_enabled:
+        batcher = get_batcher()
+        batcher.start()
+        logger.info(
+            f"Micro-batching enabled (max={settings.batch_max_size}, "
+            f"timeout={settings.batch_timeout_ms}ms)"
+        )
+
     yield
-    
+
     logger.info("Shutting down...")
+    if batcher is not None:
+        await batcher.stop()
+
 
+# Feature order expected by PredictionService._prepare_features
+BOOTSTRAP_FEATURES = [
+    "day_of_week",
+    "hour",
+    "job_type_len",
+    "execution_count",
+    "avg_duration_ms",
+    "failure_rate",
+]
 
-def train_bootstrap_model() -> XGBClassifier:
+
+def train_bootstrap_model(seed: int = 42) -> XGBClassifier:
     """Train a bootstrap model for initial predictions"""
     n_samples = 1000
-    X = pd.DataFrame({
-        "day_of_week": np.random.randint(0, 7, n_samples),
-        "hour": np.random.randint(0, 24, n_samples),
-        "job_type_len": np.random.randint(4, 10, n_samples),
-        # Additional operational features expected by PredictionService
-        "execution_count": np.random.randint(0, 200, n_samples),
-        "avg_duration_ms": np.random.exponential(scale=1000.0, size=n_samples),
-        "failure_rate": np.random.random(n_samples),
-    })
-    
-    # Simulate failure patterns
-    y = []
-    for _, row in X.iterrows():
-        prob = 0.1
-        if row["day_of_week"] >= 5:  # Weekend
-            prob += 0.3
-        if row["hour"] < 6:  # Late night
-            prob += 0.2
-        y.append(1 if np.random.random() < prob else 0)
-    
+    rng = np.random.default_rng(seed)
+
+    # Build the feature matrix as float32 directly: XGBoost converts to
+    # float32 internally anyway, so float64 (and the DataFrame wrapper)
+    # would only cost extra memory bandwidth
+    dow = rng.integers(0, 7, n_samples)
+    hr = rng.integers(0, 24, n_samples)
+    X = np.empty((n_samples, len(BOOTSTRAP_FEATURES)), dtype=np.float32)
+    X[:, 0] = dow
+    X[:, 1] = hr
+    X[:, 2] = rng.integers(4, 10, n_samples)
+    # Additional operational features expected by PredictionService
+    X[:, 3] = rng.integers(0, 200, n_samples)
+    X[:, 4] = rng.exponential(scale=1000.0, size=n_samples)
+    X[:, 5] = rng.random(n_samples)
+
+    # Simulate failure patterns: weekends and late nights fail more often
+    prob = np.full(n_samples, 0.1)
+    prob += np.where(dow >= 5, 0.3, 0.0)  # Weekend
+    prob += np.where(hr < 6, 0.2, 0.0)  # Late night
+    y = (rng.random(n_samples) < prob).astype(np.int8)
+
     model = XGBClassifier(n_estimators=100, max_depth=3, eval_metric="logloss")
     model.fit(X, y)
     return model
@@ -109,6 +144,7 @@ def create_app() -> FastAPI:
         description="AI-powered job failure prediction and analysis",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
     )
@@ -158,4 +194,9 @@ if __name__ == "__main__":
         port=settings.port,
         workers=settings.workers if settings.environment != "development" else 1,
         reload=settings.debug,
+        # uvicorn[standard] ships both: libuv event loop + C HTTP parser
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=1000,
+        backlog=4096,
     )
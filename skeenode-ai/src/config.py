@@ -33,16 +33,24 @@ class Settings(BaseSettings):
     model_path: str = Field(default="./models", env="MODEL_PATH")
     model_version: Optional[str] = Field(default=None, env="MODEL_VERSION")
     auto_reload_interval: int = Field(default=30, env="MODEL_RELOAD_INTERVAL")
+    xgb_device: str = Field(default="cpu", env="XGB_DEVICE")  # "cpu" or "cuda"
     
     # Feature flags
     ab_testing_enabled: bool = Field(default=True, env="AB_TESTING_ENABLED")
     prediction_caching_enabled: bool = Field(default=True, env="PREDICTION_CACHE_ENABLED")
     cache_ttl_seconds: int = Field(default=300, env="CACHE_TTL_SECONDS")
+
+    # Micro-batching (amortizes per-call model overhead under concurrency)
+    micro_batching_enabled: bool = Field(default=False, env="PREDICT_MICROBATCH_ENABLED")
+    batch_max_size: int = Field(default=64, env="PREDICT_BATCH_MAX_SIZE")
+    batch_timeout_ms: float = Field(default=5.0, env="PREDICT_BATCH_TIMEOUT_MS")
     
     # Rate limiting
     rate_limit_enabled: bool = Field(default=True, env="RATE_LIMIT_ENABLED")
     rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
     rate_limit_window: int = Field(default=60, env="RATE_LIMIT_WINDOW")
+    # Enforce limits globally via Redis instead of per-worker in memory
+    rate_limit_distributed: bool = Field(default=False, env="RATE_LIMIT_DISTRIBUTED")
     
     # Tracing
     otel_enabled: bool = Field(default=False, env="OTEL_ENABLED")
@@ -6,18 +6,58 @@ transforms it into features for model training.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from numba import njit, prange
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
 logger = logging.getLogger(__name__)
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _time_feature_kernel(dow, hour, out_weekend, out_night, out_business):
+    """Fused elementwise derivation of the boolean time features.
+
+    One pass over the day-of-week/hour arrays instead of five separate
+    NumPy comparisons, so each element is touched exactly once and the
+    intermediate boolean temporaries never materialize.
+    """
+    for i in prange(dow.shape[0]):
+        h = hour[i]
+        out_weekend[i] = dow[i] >= 5
+        out_night[i] = h < 6 or h >= 22
+        out_business[i] = 9 <= h < 17
+
+
+@njit(cache=True)
+def _job_stats_kernel(codes, is_failed, duration_ms, ngroups):
+    """Single-pass per-group reduce over factorized job_id codes.
+
+    Serial on purpose: the scatter-adds into per-group accumulators would
+    race under prange, and one compiled pass is already far from the
+    bottleneck at the sizes this path handles.
+    """
+    counts = np.zeros(ngroups, np.int64)
+    fails = np.zeros(ngroups, np.int64)
+    dur_sum = np.zeros(ngroups, np.float64)
+    dur_cnt = np.zeros(ngroups, np.int64)
+    for i in range(codes.size):
+        c = codes[i]
+        counts[c] += 1
+        fails[c] += is_failed[i]
+        d = duration_ms[i]
+        if not np.isnan(d):
+            dur_sum[c] += d
+            dur_cnt[c] += 1
+    return counts, fails, dur_sum, dur_cnt
+
+
 @dataclass
 class TrainingDataConfig:
     """Configuration for training data collection"""
@@ -73,7 +113,23 @@ class TrainingDataCollector:
       AND e.status IN ('SUCCESS', 'FAILED')
     ORDER BY e.completed_at DESC
     """
-    
+
+    # Per-job statistics aggregated server-side: one row per job comes back
+    # over the wire instead of one row per execution
+    JOB_STATS_QUERY = """
+    SELECT
+        e.job_id,
+        COUNT(*) AS execution_count,
+        AVG((e.status = 'FAILED')::int) AS historical_failure_rate,
+        AVG(EXTRACT(EPOCH FROM (e.completed_at - e.started_at)) * 1000)
+            FILTER (WHERE e.status = 'SUCCESS') AS avg_duration_ms
+    FROM executions e
+    WHERE e.completed_at IS NOT NULL
+      AND e.completed_at >= :start_date
+      AND e.status IN ('SUCCESS', 'FAILED')
+    GROUP BY e.job_id
+    """
+
     def __init__(
         self,
         config: Optional[TrainingDataConfig] = None,
@@ -81,6 +137,8 @@ class TrainingDataCollector:
     ):
         self.config = config or TrainingDataConfig()
         self._engine = engine
+        # Populated by _engineer_features; maps job_type code -> label
+        self.job_type_categories_: Optional[List[str]] = None
     
     @property
     def engine(self) -> Engine:
@@ -100,21 +158,34 @@ class TrainingDataCollector:
             Tuple of (X: features DataFrame, y: labels Series)
         """
         logger.info("Collecting training data from database...")
-        
-        # Fetch raw execution data
-        raw_df = self._fetch_executions()
-        
+
+        # Fetch raw execution data; the per-job stats aggregate runs
+        # concurrently on a second pooled connection
+        job_stats = None
+        if self.config.include_historical_features:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                raw_future = pool.submit(self._fetch_executions)
+                stats_future = pool.submit(self._fetch_job_statistics)
+                raw_df = raw_future.result()
+                job_stats = stats_future.result()
+        else:
+            raw_df = self._fetch_executions()
+
         if len(raw_df) < self.config.min_samples:
             logger.warning(
                 f"Only {len(raw_df)} samples found, need {self.config.min_samples}. "
                 "Using synthetic augmentation."
             )
             raw_df = self._augment_with_synthetic(raw_df)
-        
+            # The DB aggregate doesn't know the synthetic jobs; recompute
+            # stats over the augmented frame (small by definition here)
+            if self.config.include_historical_features:
+                job_stats = self._compute_job_statistics(raw_df)
+
         logger.info(f"Collected {len(raw_df)} execution records")
         
         # Engineer features
-        features_df = self._engineer_features(raw_df)
+        features_df = self._engineer_features(raw_df, job_stats)
         
         # Create labels (1 = failure, 0 = success)
         labels = (raw_df["status"] == "FAILED").astype(int)
@@ -140,37 +211,100 @@ class TrainingDataCollector:
     def _fetch_executions(self) -> pd.DataFrame:
         """Fetch execution history from PostgreSQL"""
         start_date = datetime.utcnow() - timedelta(days=self.config.lookback_days)
-        
-        with self.engine.connect() as conn:
-            result = conn.execute(
-                text(self.EXECUTION_QUERY),
-                {"start_date": start_date},
-            )
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
-        
-        return df
+
+        # read_sql_query streams rows straight into typed columns instead of
+        # materializing every row as a Python tuple first; parse_dates types
+        # the timestamp columns at read time so no later to_datetime pass
+        # has to re-infer them
+        return pd.read_sql_query(
+            text(self.EXECUTION_QUERY),
+            self.engine,
+            params={"start_date": start_date},
+            parse_dates=["scheduled_at", "started_at", "completed_at"],
+        )
     
-    def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _fetch_job_statistics(self) -> pd.DataFrame:
+        """Fetch per-job statistics aggregated by PostgreSQL"""
+        start_date = datetime.utcnow() - timedelta(days=self.config.lookback_days)
+
+        df = pd.read_sql_query(
+            text(self.JOB_STATS_QUERY),
+            self.engine,
+            params={"start_date": start_date},
+        )
+        return df.set_index("job_id")
+
+    def _compute_job_statistics(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute per-job statistics in memory (augmented-data path).
+
+        Factorize job_id once and reduce all three statistics in a single
+        compiled pass over the codes, instead of a pandas groupby per
+        aggregation.
+        """
+        codes, uniques = pd.factorize(df["job_id"], sort=False)
+        is_failed = (df["status"] == "FAILED").to_numpy(np.int8)
+        duration_ms = (
+            (pd.to_datetime(df["completed_at"]) - pd.to_datetime(df["started_at"]))
+            .dt.total_seconds()
+            .mul(1000)
+            .where(df["status"] == "SUCCESS")
+            .to_numpy(np.float64)
+        )
+
+        counts, fails, dur_sum, dur_cnt = _job_stats_kernel(
+            codes.astype(np.int64), is_failed, duration_ms, len(uniques)
+        )
+
+        return pd.DataFrame({
+            "execution_count": counts,
+            "historical_failure_rate": fails / counts,
+            "avg_duration_ms": np.where(
+                dur_cnt > 0, dur_sum / np.maximum(dur_cnt, 1), np.nan
+            ),
+        }, index=pd.Index(uniques, name="job_id"))
+
+    def _engineer_features(
+        self, df: pd.DataFrame, job_stats: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
         """Transform raw data into ML features"""
         features = pd.DataFrame(index=df.index)
         
-        # Time-based features
+        # Time-based features (parse the timestamp column once, then derive)
         if self.config.include_time_features:
-            features["day_of_week"] = pd.to_datetime(df["scheduled_at"]).dt.dayofweek
-            features["hour"] = pd.to_datetime(df["scheduled_at"]).dt.hour
-            features["is_weekend"] = features["day_of_week"] >= 5
-            features["is_night"] = (features["hour"] < 6) | (features["hour"] >= 22)
-            features["is_business_hours"] = (features["hour"] >= 9) & (features["hour"] < 17)
+            sched = pd.to_datetime(df["scheduled_at"], cache=True)
+            dow = sched.dt.dayofweek.to_numpy(np.int8)
+            hour = sched.dt.hour.to_numpy(np.int8)
+
+            n = len(df)
+            is_weekend = np.empty(n, np.bool_)
+            is_night = np.empty(n, np.bool_)
+            is_business = np.empty(n, np.bool_)
+            _time_feature_kernel(dow, hour, is_weekend, is_night, is_business)
+
+            features["day_of_week"] = dow
+            features["hour"] = hour
+            features["is_weekend"] = is_weekend
+            features["is_night"] = is_night
+            features["is_business_hours"] = is_business
         
-        # Job characteristics
+        # Job characteristics. category dtype gives int8 codes instead of
+        # factorize's int64 and keeps the code->label mapping, which is
+        # persisted with the model so inference can apply the same encoding
         if self.config.include_job_features:
-            features["job_type_encoded"] = df["job_type"].factorize()[0]
-            features["command_length"] = df["command"].str.len()
+            jt = df["job_type"].astype("category")
+            features["job_type_encoded"] = jt.cat.codes.astype(np.int8)
+            self.job_type_categories_ = list(jt.cat.categories)
+            # One tight C loop into a preallocated int32 array; the .str
+            # accessor dispatches Python-level per cell on object dtype
+            cmd = df["command"].to_numpy()
+            features["command_length"] = np.fromiter(
+                map(len, cmd), dtype=np.int32, count=len(cmd)
+            )
             features["has_schedule"] = df["schedule"].notna().astype(int)
         
-        # Historical features (per-job statistics)
-        if self.config.include_historical_features:
-            job_stats = self._compute_job_statistics(df)
+        # Historical features (per-job statistics, aggregated in the database;
+        # jobs absent from the stats frame — e.g. synthetic rows — fill to 0)
+        if self.config.include_historical_features and job_stats is not None:
             features = features.merge(
                 job_stats,
                 left_on=df["job_id"],
@@ -183,83 +317,84 @@ class TrainingDataCollector:
         
         return features
     
-    def _compute_job_statistics(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Compute per-job historical statistics"""
-        job_stats = df.groupby("job_id").agg({
-            "execution_id": "count",
-            "status": lambda x: (x == "FAILED").mean(),
-        }).rename(columns={
-            "execution_id": "execution_count",
-            "status": "historical_failure_rate",
-        })
-        
-        # Compute average duration for successful executions
-        successful = df[df["status"] == "SUCCESS"].copy()
-        if len(successful) > 0 and "started_at" in successful.columns:
-            successful["started_at"] = pd.to_datetime(successful["started_at"])
-            successful["completed_at"] = pd.to_datetime(successful["completed_at"])
-            successful["duration_ms"] = (
-                (successful["completed_at"] - successful["started_at"])
-                .dt.total_seconds() * 1000
-            )
-            duration_stats = successful.groupby("job_id")["duration_ms"].mean()
-            job_stats["avg_duration_ms"] = duration_stats
-        
-        return job_stats
-    
     def _balance_classes(
         self, X: pd.DataFrame, y: pd.Series
     ) -> Tuple[pd.DataFrame, pd.Series]:
         """Balance success/failure classes via undersampling"""
-        n_failures = y.sum()
-        n_successes = len(y) - n_failures
-        
-        if n_failures == 0 or n_successes == 0:
+        y_arr = y.to_numpy()
+        failure_pos = np.flatnonzero(y_arr == 1)
+        success_pos = np.flatnonzero(y_arr == 0)
+
+        if len(failure_pos) == 0 or len(success_pos) == 0:
             return X, y
-        
-        # Undersample majority class
-        minority_size = min(n_failures, n_successes)
-        
-        failure_indices = y[y == 1].index
-        success_indices = y[y == 0].index
-        
-        if n_failures > n_successes:
-            failure_indices = np.random.choice(failure_indices, minority_size, replace=False)
+
+        # Undersample the majority class: one permutation truncated to the
+        # minority size replaces choice(replace=False)'s O(N log N) sort
+        minority_size = min(len(failure_pos), len(success_pos))
+        rng = np.random.default_rng(42)
+
+        if len(failure_pos) > len(success_pos):
+            failure_pos = rng.permutation(failure_pos)[:minority_size]
         else:
-            success_indices = np.random.choice(success_indices, minority_size, replace=False)
-        
-        indices = np.concatenate([failure_indices, success_indices])
-        np.random.shuffle(indices)
-        
-        return X.loc[indices], y.loc[indices]
+            success_pos = rng.permutation(success_pos)[:minority_size]
+
+        positions = np.concatenate([failure_pos, success_pos])
+        rng.shuffle(positions)
+
+        # iloc on positional indices skips the per-element hash lookup
+        # that .loc pays on a non-monotonic index
+        return X.iloc[positions], y.iloc[positions]
     
     def _augment_with_synthetic(self, df: pd.DataFrame) -> pd.DataFrame:
         """Augment with synthetic data when real data is insufficient"""
-        n_needed = self.config.min_samples - len(df)
-        
+        n_real = len(df)
+        n_needed = self.config.min_samples - n_real
+        n_total = n_real + n_needed
+
         logger.info(f"Generating {n_needed} synthetic training samples")
-        
-        # Generate synthetic executions
-        synthetic = pd.DataFrame({
-            "execution_id": [f"synthetic_{i}" for i in range(n_needed)],
-            "job_id": [f"synthetic_job_{i % 10}" for i in range(n_needed)],
-            "status": np.random.choice(["SUCCESS", "FAILED"], n_needed, p=[0.85, 0.15]),
-            "scheduled_at": [
-                datetime.utcnow() - timedelta(hours=np.random.randint(1, 2000))
-                for _ in range(n_needed)
-            ],
-            "started_at": None,
-            "completed_at": None,
-            "exit_code": 0,
-            "node_id": "synthetic-node",
-            "job_name": "synthetic-job",
-            "job_type": np.random.choice(["SHELL", "DOCKER", "HTTP"], n_needed),
-            "command": "echo synthetic",
-            "schedule": "*/5 * * * *",
-            "owner_id": "synthetic-owner",
-        })
-        
-        return pd.concat([df, synthetic], ignore_index=True)
+
+        # Fill one preallocated buffer per column — real rows at the front,
+        # generated rows behind them — instead of building a synthetic
+        # DataFrame and pd.concat'ing (which reallocates every column and
+        # doubles peak memory right when this path matters most)
+        def _column(name, dtype, synthetic_values):
+            out = np.empty(n_total, dtype=dtype)
+            if n_real:
+                out[:n_real] = df[name].to_numpy()
+            out[n_real:] = synthetic_values
+            return out
+
+        idx = np.arange(n_needed)
+        hours_back = np.random.randint(1, 2000, n_needed)
+        scheduled = pd.Timestamp.utcnow().tz_localize(None).to_datetime64() - (
+            pd.to_timedelta(hours_back, unit="h").to_numpy()
+        )
+
+        return pd.DataFrame({
+            "execution_id": _column(
+                "execution_id", object, np.char.add("synthetic_", idx.astype(str))
+            ),
+            "job_id": _column(
+                "job_id", object, np.char.add("synthetic_job_", (idx % 10).astype(str))
+            ),
+            "status": _column(
+                "status", object,
+                np.random.choice(["SUCCESS", "FAILED"], n_needed, p=[0.85, 0.15]),
+            ),
+            "scheduled_at": _column("scheduled_at", "datetime64[ns]", scheduled),
+            "started_at": _column("started_at", object, None),
+            "completed_at": _column("completed_at", object, None),
+            "exit_code": _column("exit_code", object, 0),
+            "node_id": _column("node_id", object, "synthetic-node"),
+            "job_name": _column("job_name", object, "synthetic-job"),
+            "job_type": _column(
+                "job_type", object,
+                np.random.choice(["SHELL", "DOCKER", "HTTP"], n_needed),
+            ),
+            "command": _column("command", object, "echo synthetic"),
+            "schedule": _column("schedule", object, "*/5 * * * *"),
+            "owner_id": _column("owner_id", object, "synthetic-owner"),
+        }, copy=False)
 
 
 def get_training_data(
@@ -1,11 +1,14 @@
+import asyncio
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 import uvicorn
 import os
 import pandas as pd
 import numpy as np
+import xgboost as xgb
 from xgboost import XGBClassifier
-import joblib
 import logging
 from typing import Dict, Any
 
@@ -13,10 +16,74 @@ from typing import Dict, Any
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Skeenode Intelligence Service")
-
-# Global model variable
-model = None
+# orjson encodes the small response dicts roughly twice as fast as the
+# stdlib json default
+app = FastAPI(
+    title="Skeenode Intelligence Service",
+    default_response_class=ORJSONResponse,
+)
+
+# Global booster (raw model; all serving goes through inplace_predict)
+booster = None
+
+# Micro-batching: requests arriving within MAX_WAIT_MS are stacked into one
+# matrix and predicted with a single booster call, amortizing the fixed
+# per-invocation overhead across the batch
+MAX_BATCH = 64
+MAX_WAIT_MS = 2.0
+
+_batch_queue: "asyncio.Queue[tuple[Dict[str, Any], asyncio.Future]]" = None
+_batch_task: asyncio.Task = None
+# Only the batch worker touches this buffer, so a plain module global is safe
+_batch_buf = np.empty((MAX_BATCH, 3), dtype=np.float32)
+
+
+def _fill_row(buf: np.ndarray, row: int, features: Dict[str, Any]):
+    # Mock encoding for job_type since we don't have a real encoder persisted yet
+    job_type = features.get("job_type", "SHELL")
+    buf[row, 0] = features.get('day_of_week', 0)
+    buf[row, 1] = features.get('hour', 12)
+    buf[row, 2] = len(job_type)
+
+
+def _predict_batch_rows(feature_dicts: list) -> np.ndarray:
+    for i, features in enumerate(feature_dicts):
+        _fill_row(_batch_buf, i, features)
+    return booster.inplace_predict(_batch_buf[:len(feature_dicts)])
+
+
+async def _batch_worker():
+    loop = asyncio.get_running_loop()
+    while True:
+        # Block for the first item, then drain for up to MAX_WAIT_MS
+        items = [await _batch_queue.get()]
+        deadline = loop.time() + MAX_WAIT_MS / 1000.0
+        while len(items) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(_batch_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            probs = await run_in_threadpool(
+                _predict_batch_rows, [features for features, _ in items]
+            )
+            for (_, future), prob in zip(items, probs):
+                if not future.done():
+                    future.set_result(float(prob))
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+
+
+async def _submit(features: Dict[str, Any]) -> float:
+    future = asyncio.get_running_loop().create_future()
+    await _batch_queue.put((features, future))
+    return await future
 
 class PredictionRequest(BaseModel):
     job_id: str
@@ -30,11 +97,15 @@ class PredictionResponse(BaseModel):
 
 @app.on_event("startup")
 def load_or_train_model():
-    global model
-    model_path = "model.joblib"
+    global booster
+    # UBJSON is xgboost's native format: loading skips the full pickle
+    # deserialization copy, and the file is backed by the OS page cache so
+    # forked uvicorn workers share the same physical pages
+    model_path = "model.ubj"
     if os.path.exists(model_path):
         logger.info("Loading existing model...")
-        model = joblib.load(model_path)
+        booster = xgb.Booster()
+        booster.load_model(model_path)
     else:
         logger.info("Training initial dummy model...")
         # Train a dummy model
@@ -43,54 +114,57 @@ def load_or_train_model():
 
         # Create synthetic data
         n_samples = 1000
+        rng = np.random.default_rng(42)
         X = pd.DataFrame({
-            'day_of_week': np.random.randint(0, 7, n_samples),
-            'hour': np.random.randint(0, 24, n_samples),
-            'job_type_len': np.random.randint(4, 10, n_samples) # Mock encoding
+            'day_of_week': rng.integers(0, 7, n_samples),
+            'hour': rng.integers(0, 24, n_samples),
+            'job_type_len': rng.integers(4, 10, n_samples) # Mock encoding
         })
 
         # Simulate some logic: weekends have higher failure rate, late night has higher failure rate
-        y = []
-        for _, row in X.iterrows():
-            prob = 0.1
-            if row['day_of_week'] >= 5: # Weekend
-                prob += 0.3
-            if row['hour'] < 6: # Late night
-                prob += 0.2
-            y.append(1 if np.random.random() < prob else 0)
+        dow = X['day_of_week'].to_numpy()
+        hour = X['hour'].to_numpy()
+        prob = np.full(n_samples, 0.1)
+        prob += 0.3 * (dow >= 5) # Weekend
+        prob += 0.2 * (hour < 6) # Late night
+        y = (rng.random(n_samples) < prob).astype(np.int8)
 
         model = XGBClassifier(n_estimators=100, max_depth=3, eval_metric='logloss')
-        model.fit(X, y)
-        joblib.dump(model, model_path)
+        model.fit(X.values, y)
+        booster = model.get_booster()
+        booster.save_model(model_path)
         logger.info("Model trained and saved.")
 
+
+@app.on_event("startup")
+async def start_batch_worker():
+    global _batch_queue, _batch_task
+    _batch_queue = asyncio.Queue()
+    _batch_task = asyncio.get_running_loop().create_task(_batch_worker())
+
+
+@app.on_event("shutdown")
+async def stop_batch_worker():
+    if _batch_task is not None:
+        _batch_task.cancel()
+
 @app.get("/health")
 def health_check():
-    status = "healthy" if model is not None else "degraded"
+    status = "healthy" if booster is not None else "degraded"
     return {"status": status, "service": "skeenode-ai"}
 
 @app.post("/predict/failure", response_model=PredictionResponse)
-def predict_failure(req: PredictionRequest):
-    global model
-    if model is None:
+async def predict_failure(req: PredictionRequest):
+    if booster is None:
         raise HTTPException(status_code=503, detail="Model not loaded")
 
     try:
         # Preprocess features
         # Expecting features like: {"day_of_week": 1, "hour": 10, "job_type": "SHELL"}
 
-        # Mock encoding for job_type since we don't have a real encoder persisted yet
-        job_type = req.features.get("job_type", "SHELL")
-        job_type_len = len(job_type)
-
-        features_df = pd.DataFrame([{
-            'day_of_week': req.features.get('day_of_week', 0),
-            'hour': req.features.get('hour', 12),
-            'job_type_len': job_type_len
-        }])
-
-        # Predict probability of class 1 (Failure)
-        prob_fail = model.predict_proba(features_df)[0][1]
+        # Queue into the micro-batcher: one booster call per batch instead
+        # of one per request under concurrent load
+        prob_fail = await _submit(req.features)
 
         decision = "PROCEED"
         if prob_fail > 0.7:
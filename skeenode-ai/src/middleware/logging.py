@@ -4,12 +4,13 @@ Request Logging Middleware
 Structured JSON logging for all requests with timing.
 """
 
-import json
 import logging
+import secrets
 import time
-import uuid
 from typing import Callable
 
+import orjson
+
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -22,17 +23,18 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Log all requests with structured JSON output"""
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate request ID
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4())[:8])
-        
-        # Start timer
-        start_time = time.time()
+        # Generate request ID (token_hex reads 4 random bytes straight to
+        # hex; no UUID object construction or 36-char format to slice)
+        request_id = request.headers.get("X-Request-ID") or secrets.token_hex(4)
         
+        # Start timer (monotonic ns: immune to NTP steps, integer subtract)
+        start_ns = time.perf_counter_ns()
+
         # Process request
         response = await call_next(request)
-        
+
         # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
         
         # Add request ID to response
         response.headers["X-Request-ID"] = request_id
@@ -48,13 +50,15 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             "user_agent": request.headers.get("User-Agent", ""),
         }
         
-        # Log level based on status code
+        # Log level based on status code (orjson: one C-level encode per
+        # request instead of json.dumps' per-key Python dispatch)
+        line = orjson.dumps(log_data).decode()
         if response.status_code >= 500:
-            logger.error(json.dumps(log_data))
+            logger.error(line)
         elif response.status_code >= 400:
-            logger.warning(json.dumps(log_data))
+            logger.warning(line)
         else:
-            logger.info(json.dumps(log_data))
+            logger.info(line)
         
         return response
 
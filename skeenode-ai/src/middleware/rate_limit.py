@@ -4,110 +4,278 @@ Rate Limiting Middleware
 Token bucket rate limiting with per-client tracking.
 """
 
+import logging
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from dataclasses import dataclass
 from threading import Lock
-from typing import Dict, Optional
-
-from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional
 
 from ..config import settings
+from ..redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+# One token expressed in fixed-point micro-tokens; integer arithmetic on
+# the hot path beats float multiply/min and is immune to wall-clock jumps
+_MICRO = 1_000_000
 
 
 @dataclass
 class TokenBucket:
-    """Token bucket for rate limiting"""
-    tokens: float
-    last_refill: float
-    rate: float  # tokens per second
-    capacity: int
+    """Token bucket for rate limiting.
+
+    Tokens are stored as fixed-point micro-tokens and refill timestamps
+    as ``time.monotonic_ns()`` integers; rate and capacity live on the
+    limiter, which shares them across all buckets.
+    """
+    tokens: int  # micro-tokens
+    last_refill: int  # monotonic nanoseconds
+
+
+# Stripe count for the rate limiter's lock array; must be a power of two
+# so stripe selection is a single mask
+_N_STRIPES = 256
+
+# Bucket-table bound: memory stays O(active clients) instead of growing
+# with every unique X-Forwarded-For ever seen
+_MAX_BUCKETS = 10_000
+_SWEEP_INTERVAL_SECONDS = 60
+
+# Health endpoints are probe traffic, never limited. A module-level
+# frozenset keeps the per-request check to one LOAD_GLOBAL + hash probe.
+_SKIP_PATHS = frozenset({"/health", "/ready", "/live"})
 
 
 class RateLimiter:
-    """Thread-safe rate limiter with per-client tracking"""
-    
+    """Thread-safe rate limiter with per-client tracking.
+
+    Locking is striped by client id: unrelated clients hash to different
+    stripes and proceed in parallel instead of serializing on one global
+    mutex. Within a stripe the critical section is a handful of float ops.
+    """
+
     def __init__(
         self,
         requests_per_window: int = 100,
         window_seconds: int = 60,
     ):
-        self.rate = requests_per_window / window_seconds
-        self.capacity = requests_per_window
-        self.buckets: Dict[str, TokenBucket] = {}
-        self.lock = Lock()
-    
+        self.capacity_micro = requests_per_window * _MICRO
+        self.window_seconds = window_seconds
+        # Refill as an integer ratio of micro-tokens per nanosecond:
+        # refilled = elapsed_ns * num // den
+        self._refill_num = requests_per_window * _MICRO
+        self._refill_den = window_seconds * 1_000_000_000
+        # LRU-ordered: recently seen clients at the end, eviction candidates
+        # at the front
+        self.buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._stripe_locks = [Lock() for _ in range(_N_STRIPES)]
+
+        # Background sweeper drops buckets idle for two windows, mirroring
+        # the registry's _auto_reload_loop daemon-thread pattern
+        self._sweep_thread = threading.Thread(
+            target=self._sweep_loop,
+            daemon=True,
+        )
+        self._sweep_thread.start()
+
+    def _lock_for(self, client_id: str) -> Lock:
+        return self._stripe_locks[hash(client_id) & (_N_STRIPES - 1)]
+
     def allow(self, client_id: str) -> bool:
         """Check if request is allowed"""
-        with self.lock:
-            now = time.time()
-            
-            if client_id not in self.buckets:
-                self.buckets[client_id] = TokenBucket(
-                    tokens=self.capacity,
+        with self._lock_for(client_id):
+            now = time.monotonic_ns()
+
+            bucket = self.buckets.get(client_id)
+            if bucket is None:
+                bucket = self.buckets[client_id] = TokenBucket(
+                    tokens=self.capacity_micro,
                     last_refill=now,
-                    rate=self.rate,
-                    capacity=self.capacity,
                 )
-            
-            bucket = self.buckets[client_id]
-            
-            # Refill tokens
-            elapsed = now - bucket.last_refill
-            bucket.tokens = min(
-                bucket.capacity,
-                bucket.tokens + elapsed * bucket.rate,
-            )
-            bucket.last_refill = now
-            
+            else:
+                # Refill: pure integer math on the monotonic clock
+                elapsed_ns = now - bucket.last_refill
+                bucket.tokens = min(
+                    self.capacity_micro,
+                    bucket.tokens + elapsed_ns * self._refill_num // self._refill_den,
+                )
+                bucket.last_refill = now
+
+            # LRU bookkeeping: move the touched bucket to the tail and evict
+            # the coldest entry once over the cap
+            try:
+                self.buckets.move_to_end(client_id)
+            except KeyError:
+                # An eviction from another stripe can pop this entry
+                # between the lookup above and the touch; reinsert the
+                # bucket we already updated instead of raising
+                self.buckets[client_id] = bucket
+            if len(self.buckets) > _MAX_BUCKETS:
+                self.buckets.popitem(last=False)
+
             # Check if allowed
-            if bucket.tokens >= 1:
-                bucket.tokens -= 1
+            if bucket.tokens >= _MICRO:
+                bucket.tokens -= _MICRO
                 return True
-            
+
             return False
-    
+
     def get_retry_after(self, client_id: str) -> int:
         """Get seconds until next token available"""
-        with self.lock:
+        with self._lock_for(client_id):
             bucket = self.buckets.get(client_id)
-            if bucket is None or bucket.tokens >= 1:
+            if bucket is None or bucket.tokens >= _MICRO:
+                return 0
+            deficit = _MICRO - bucket.tokens
+            wait_ns = deficit * self._refill_den // self._refill_num
+            return int(wait_ns // 1_000_000_000) + 1
+
+    def _sweep_loop(self) -> None:
+        """Periodically drop buckets idle for more than two windows"""
+        while True:
+            time.sleep(_SWEEP_INTERVAL_SECONDS)
+            try:
+                cutoff = time.monotonic_ns() - 2 * self.window_seconds * 1_000_000_000
+                # LRU order means we can stop at the first fresh entry
+                for client_id, bucket in list(self.buckets.items()):
+                    if bucket.last_refill >= cutoff:
+                        break
+                    # Take the owning stripe lock so we never pop an entry
+                    # out from under a concurrent allow() for the same
+                    # client, and re-check freshness: allow() may have
+                    # refilled the bucket since the snapshot above
+                    with self._lock_for(client_id):
+                        current = self.buckets.get(client_id)
+                        if current is not None and current.last_refill < cutoff:
+                            self.buckets.pop(client_id, None)
+            except Exception as e:
+                logger.warning(f"Rate limit sweep failed: {e}")
+
+
+# Token-bucket refill + decrement in one atomic round-trip. Runs entirely
+# server-side, so the bucket state is consistent across workers and pods.
+# KEYS[1] bucket hash; ARGV: now, rate (tokens/s), capacity, ttl seconds.
+_TOKEN_BUCKET_LUA = """
+local t = tonumber(redis.call('HGET', KEYS[1], 't')) or tonumber(ARGV[3])
+local ts = tonumber(redis.call('HGET', KEYS[1], 'ts')) or tonumber(ARGV[1])
+t = math.min(tonumber(ARGV[3]), t + (tonumber(ARGV[1]) - ts) * tonumber(ARGV[2]))
+if t >= 1 then
+    t = t - 1
+    redis.call('HSET', KEYS[1], 't', t, 'ts', ARGV[1])
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return 1
+else
+    return 0
+end
+"""
+
+
+class RedisRateLimiter:
+    """Redis-backed rate limiter for multi-worker/multi-pod deployments.
+
+    The in-process RateLimiter gives each uvicorn worker its own quota;
+    this variant keeps the bucket in Redis and runs the whole check as a
+    single EVALSHA'd Lua script — atomic, one RTT per request.
+    """
+
+    KEY_PREFIX = "skeenode:ratelimit:"
+
+    def __init__(
+        self,
+        requests_per_window: int = 100,
+        window_seconds: int = 60,
+        redis_url: str = None,
+    ):
+        self.rate = requests_per_window / window_seconds
+        self.capacity = requests_per_window
+        # Keep idle buckets around for two windows, then let Redis expire them
+        self.ttl = window_seconds * 2
+        self.redis = get_redis_client(redis_url)
+        # register_script does SCRIPT LOAD once and EVALSHAs from then on
+        self._script = self.redis.register_script(_TOKEN_BUCKET_LUA)
+
+    def allow(self, client_id: str) -> bool:
+        """Check if request is allowed (fails open if Redis is down)"""
+        try:
+            return bool(self._script(
+                keys=[self.KEY_PREFIX + client_id],
+                args=[time.time(), self.rate, self.capacity, self.ttl],
+            ))
+        except Exception as e:
+            logger.warning(f"Rate limit check failed, allowing request: {e}")
+            return True
+
+    def get_retry_after(self, client_id: str) -> int:
+        """Get seconds until next token available"""
+        try:
+            tokens = self.redis.hget(self.KEY_PREFIX + client_id, "t")
+            if tokens is None or float(tokens) >= 1:
                 return 0
-            return int((1 - bucket.tokens) / bucket.rate) + 1
+            return int((1 - float(tokens)) / self.rate) + 1
+        except Exception:
+            return 0
+
 
+class RateLimitMiddleware:
+    """Rate limiting as a plain ASGI middleware.
+
+    BaseHTTPMiddleware spawns an anyio task group and materializes
+    Request/Response objects per call; operating on the raw scope keeps
+    the allow/deny check to a dict lookup plus a header scan.
+    """
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware for rate limiting"""
-    
     def __init__(self, app, limiter: Optional[RateLimiter] = None):
-        super().__init__(app)
-        self.limiter = limiter or RateLimiter(
-            requests_per_window=settings.rate_limit_requests,
-            window_seconds=settings.rate_limit_window,
-        )
+        self.app = app
+        if limiter is not None:
+            self.limiter = limiter
+        elif settings.rate_limit_distributed:
+            self.limiter = RedisRateLimiter(
+                requests_per_window=settings.rate_limit_requests,
+                window_seconds=settings.rate_limit_window,
+            )
+        else:
+            self.limiter = RateLimiter(
+                requests_per_window=settings.rate_limit_requests,
+                window_seconds=settings.rate_limit_window,
+            )
         self.enabled = settings.rate_limit_enabled
-    
-    async def dispatch(self, request: Request, call_next):
-        if not self.enabled:
-            return await call_next(request)
-        
-        # Skip health endpoints
-        if request.url.path in {"/health", "/ready", "/live"}:
-            return await call_next(request)
-        
-        # Get client ID (prefer X-Forwarded-For, fallback to IP)
-        client_id = request.headers.get(
-            "X-Forwarded-For",
-            request.client.host if request.client else "unknown",
-        )
-        
+
+    async def __call__(self, scope, receive, send):
+        if (
+            not self.enabled
+            or scope["type"] != "http"
+            or scope["path"] in _SKIP_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Get client ID (prefer X-Forwarded-For, fallback to IP). ASGI
+        # header names arrive as lowercase bytes.
+        client_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                client_id = value.decode("latin-1")
+                break
+        if client_id is None:
+            client = scope.get("client")
+            client_id = client[0] if client else "unknown"
+
         if not self.limiter.allow(client_id):
             retry_after = self.limiter.get_retry_after(client_id)
-            raise HTTPException(
-                status_code=429,
-                detail="Rate limit exceeded",
-                headers={"Retry-After": str(retry_after)},
-            )
-        
-        return await call_next(request)
+            body = b'{"detail":"Rate limit exceeded"}'
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(retry_after).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self.app(scope, receive, send)
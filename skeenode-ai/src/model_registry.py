@@ -6,24 +6,37 @@ hot-reload capability, and Redis-backed version storage.
 """
 
 import os
-import json
 import time
 import hashlib
 import pickle
 from pathlib import Path
-from typing import Dict, Optional, Any, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Any, List, Protocol
+from dataclasses import dataclass, asdict, field, replace
 from datetime import datetime
 import threading
 import logging
 
-import redis
 import numpy as np
-from sklearn.base import BaseEstimator
+import orjson
+import xgboost as xgb
+
+from .redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
 
+class Predictor(Protocol):
+    """Structural type for servable models.
+
+    Anything exposing predict_proba qualifies; raw Boosters (served via
+    inplace_predict) are handled as a special case by the prediction
+    service. Keeping this a Protocol avoids importing sklearn — and the
+    scipy stack behind it — just for an annotation at worker startup.
+    """
+
+    def predict_proba(self, X) -> np.ndarray: ...
+
+
 @dataclass
 class ModelVersion:
     """Metadata for a model version"""
@@ -35,6 +48,9 @@ class ModelVersion:
     traffic_weight: float  # For A/B testing (0.0 to 1.0)
     features: List[str]
     model_type: str
+    # Categorical encoding for job_type, persisted so inference can map
+    # incoming labels to the same codes the model was trained on
+    job_type_categories: Optional[List[str]] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -44,6 +60,40 @@ class ModelVersion:
         return cls(**data)
 
 
+@dataclass(frozen=True)
+class _ReadView:
+    """Immutable snapshot of registry state published to reader threads.
+
+    Writers build a fresh view under the write lock and rebind
+    ``self._snapshot``; on CPython that attribute assignment is atomic
+    under the GIL, so readers always see a complete view — either the
+    old one or the new one — without taking any lock.
+    """
+    versions: Dict[str, ModelVersion] = field(default_factory=dict)
+    models: Dict[str, Predictor] = field(default_factory=dict)
+    # (version ids, cumulative traffic weights) for A/B dispatch
+    dispatch: Optional[tuple[List[str], np.ndarray]] = None
+    # Resolved (version_id, model) for the dominant production case of a
+    # single active version whose model is already loaded
+    single: Optional[tuple[str, Predictor]] = None
+
+
+class _HashingWriter:
+    """File-like wrapper hashing bytes as they stream to the underlying file.
+
+    Lets pickle serialize and fingerprint a model in one pass instead of
+    materializing a duplicate ``pickle.dumps`` buffer just for the hash.
+    """
+
+    def __init__(self, fileobj):
+        self.hash = hashlib.sha256()
+        self._fileobj = fileobj
+
+    def write(self, data) -> int:
+        self.hash.update(data)
+        return self._fileobj.write(data)
+
+
 class ModelRegistry:
     """
     Production model registry with:
@@ -55,6 +105,12 @@ class ModelRegistry:
     
     REGISTRY_KEY = "skeenode:model_registry"
     ACTIVE_MODEL_KEY = "skeenode:active_model"
+    # Bumped by writers on every metadata change; readers compare it to
+    # skip re-parsing an unchanged registry hash on reload
+    EPOCH_KEY = "skeenode:model_registry:epoch"
+    # Writers publish the changed version id here; other workers reload
+    # just that version instead of polling the whole hash
+    CHANGED_CHANNEL = "skeenode:model_registry:changed"
     
     def __init__(
         self,
@@ -63,18 +119,23 @@ class ModelRegistry:
         auto_reload_interval: int = 30,
     ):
         redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
-        self.redis = redis.from_url(redis_url)
+        self.redis = get_redis_client(redis_url)
         self.models_dir = Path(models_dir)
         self.models_dir.mkdir(parents=True, exist_ok=True)
         
-        self._models: Dict[str, BaseEstimator] = {}
+        # Writer-side master state, mutated only under the write lock;
+        # readers go through the published _ReadView instead
+        self._models: Dict[str, Predictor] = {}
         self._versions: Dict[str, ModelVersion] = {}
-        self._lock = threading.RLock()
+        self._write_lock = threading.RLock()
+        self._snapshot = _ReadView()
+        self._seen_epoch: Optional[int] = None
         
-        # Start auto-reload thread
+        # Start change-notification listener (heartbeats at the old
+        # polling interval as a fallback for missed messages)
         if auto_reload_interval > 0:
             self._reload_thread = threading.Thread(
-                target=self._auto_reload_loop,
+                target=self._pubsub_loop,
                 args=(auto_reload_interval,),
                 daemon=True,
             )
@@ -85,24 +146,40 @@ class ModelRegistry:
     
     def register_model(
         self,
-        model: BaseEstimator,
+        model: Predictor,
         metrics: Dict[str, float],
         features: List[str],
         model_type: str = "xgboost",
         activate: bool = False,
         traffic_weight: float = 0.0,
+        job_type_categories: Optional[List[str]] = None,
     ) -> str:
         """Register a new model version"""
-        
-        # Generate version ID based on model hash
-        model_bytes = pickle.dumps(model)
-        version_id = hashlib.sha256(model_bytes).hexdigest()[:12]
-        version_id = f"v_{version_id}_{int(time.time())}"
-        
-        # Save model to disk
-        model_path = self.models_dir / f"{version_id}.pkl"
-        with open(model_path, "wb") as f:
-            pickle.dump(model, f)
+
+        # Serialize to disk and fingerprint in a single pass; the old
+        # pickle.dumps-then-hash approach held a duplicate copy of the
+        # serialized model just to derive a 12-char version id. The final
+        # filename embeds the hash, so pickled models stream to a
+        # temporary name first.
+        if isinstance(model, xgb.XGBModel):
+            # One save_raw buffer serves both the hash and the file write
+            raw = model.get_booster().save_raw("ubj")
+            version_id = hashlib.sha256(raw).hexdigest()[:12]
+            version_id = f"v_{version_id}_{int(time.time())}"
+            model_path = self.models_dir / f"{version_id}.ubj"
+            with open(model_path, "wb") as f:
+                f.write(raw)
+        else:
+            tmp_path = self.models_dir / f".tmp_{os.getpid()}_{threading.get_ident()}.pkl"
+            with open(tmp_path, "wb") as f:
+                writer = _HashingWriter(f)
+                # Protocol 5 serializes large numpy buffers out-of-band
+                # instead of copying them through the pickle stream
+                pickle.dump(model, writer, protocol=5)
+            version_id = writer.hash.hexdigest()[:12]
+            version_id = f"v_{version_id}_{int(time.time())}"
+            model_path = self.models_dir / f"{version_id}.pkl"
+            os.replace(tmp_path, model_path)
         
         # Create version metadata
         version = ModelVersion(
@@ -114,15 +191,17 @@ class ModelRegistry:
             traffic_weight=traffic_weight,
             features=features,
             model_type=model_type,
+            job_type_categories=job_type_categories,
         )
         
         # Store in Redis
         self._store_version(version)
         
         # Load into memory
-        with self._lock:
+        with self._write_lock:
             self._models[version_id] = model
             self._versions[version_id] = version
+            self._publish_snapshot()
         
         if activate:
             self.activate_version(version_id)
@@ -132,59 +211,105 @@ class ModelRegistry:
     
     def activate_version(self, version_id: str, traffic_weight: float = 1.0) -> None:
         """Activate a model version for serving"""
-        with self._lock:
+        with self._write_lock:
             if version_id not in self._versions:
                 raise ValueError(f"Unknown version: {version_id}")
-            
-            # Deactivate other versions if setting traffic to 1.0
+
+            # Deactivate other versions if setting traffic to 1.0.
+            # Replace instances instead of mutating them: the published
+            # snapshot shares them with lock-free readers.
             if traffic_weight >= 1.0:
-                for v in self._versions.values():
-                    v.is_active = False
-                    v.traffic_weight = 0.0
-            
-            self._versions[version_id].is_active = True
-            self._versions[version_id].traffic_weight = traffic_weight
-            
+                for vid, v in list(self._versions.items()):
+                    if v.is_active or v.traffic_weight:
+                        self._versions[vid] = replace(
+                            v, is_active=False, traffic_weight=0.0
+                        )
+
+            self._versions[version_id] = replace(
+                self._versions[version_id],
+                is_active=True,
+                traffic_weight=traffic_weight,
+            )
+
             # Update Redis
             self._store_version(self._versions[version_id])
             self.redis.set(self.ACTIVE_MODEL_KEY, version_id)
+            self._publish_snapshot()
         
         logger.info(f"Activated model version: {version_id} with weight {traffic_weight}")
     
-    def get_model_for_prediction(self) -> Optional[tuple[str, BaseEstimator]]:
+    def get_model_for_prediction(self) -> Optional[tuple[str, Predictor]]:
         """
         Get a model for prediction, supporting A/B testing.
         Returns (version_id, model) tuple.
         """
-        with self._lock:
-            active_versions = [
-                v for v in self._versions.values()
-                if v.is_active and v.traffic_weight > 0
-            ]
-            
-            if not active_versions:
-                return None
-            
-            # Simple weighted random selection for A/B testing
-            weights = [v.traffic_weight for v in active_versions]
-            total = sum(weights)
-            weights = [w / total for w in weights]
-            
-            rand = np.random.random()
-            cumsum = 0
-            selected = active_versions[0]
-            for v, w in zip(active_versions, weights):
-                cumsum += w
-                if rand < cumsum:
-                    selected = v
-                    break
-            
-            model = self._models.get(selected.version_id)
-            if model is None:
-                model = self._load_model(selected)
-                self._models[selected.version_id] = model
-            
-            return selected.version_id, model
+        # Lock-free read path: dereference the published snapshot once
+        # and work off it; writers swap in a new view atomically
+        view = self._snapshot
+        if view.single is not None:
+            # Single active version with a loaded model: one attribute
+            # read, no weight math, no RNG roll
+            return view.single
+        if view.dispatch is None:
+            return None
+
+        version_ids, cumweights = view.dispatch
+        if len(version_ids) == 1:
+            version_id = version_ids[0]
+        else:
+            idx = int(np.searchsorted(cumweights, np.random.random(), side="right"))
+            version_id = version_ids[min(idx, len(version_ids) - 1)]
+
+        model = view.models.get(version_id)
+        if model is None:
+            # Cold model: load from disk under the write lock and publish
+            # a view that includes it
+            with self._write_lock:
+                model = self._models.get(version_id)
+                if model is None:
+                    version = self._versions.get(version_id)
+                    if version is None:
+                        return None
+                    model = self._load_model(version)
+                    self._models[version_id] = model
+                    self._publish_snapshot()
+
+        return version_id, model
+
+    def _publish_snapshot(self) -> None:
+        """Rebuild and atomically publish the reader view.
+
+        Must be called with the write lock held, after every mutation of
+        ``_versions`` or ``_models``.
+        """
+        versions = dict(self._versions)
+        active_versions = [
+            v for v in versions.values()
+            if v.is_active and v.traffic_weight > 0
+        ]
+        if active_versions:
+            weights = np.array(
+                [v.traffic_weight for v in active_versions], dtype=np.float64
+            )
+            dispatch = (
+                [v.version_id for v in active_versions],
+                np.cumsum(weights / weights.sum()),
+            )
+        else:
+            dispatch = None
+
+        single = None
+        if len(active_versions) == 1:
+            model = self._models.get(active_versions[0].version_id)
+            if model is not None:
+                single = (active_versions[0].version_id, model)
+
+        self._snapshot = _ReadView(
+            versions=versions,
+            models=dict(self._models),
+            dispatch=dispatch,
+            single=single,
+        )
     
     def rollback(self, version_id: str) -> None:
         """Rollback to a previous version"""
@@ -193,17 +318,15 @@ class ModelRegistry:
     
     def list_versions(self) -> List[ModelVersion]:
         """List all registered versions"""
-        with self._lock:
-            return list(self._versions.values())
-    
+        return list(self._snapshot.versions.values())
+
     def get_version(self, version_id: str) -> Optional[ModelVersion]:
         """Get a specific version's metadata"""
-        with self._lock:
-            return self._versions.get(version_id)
-    
+        return self._snapshot.versions.get(version_id)
+
     def delete_version(self, version_id: str) -> None:
         """Delete a model version"""
-        with self._lock:
+        with self._write_lock:
             if version_id not in self._versions:
                 return
             
@@ -220,44 +343,106 @@ class ModelRegistry:
             
             # Remove from Redis
             self.redis.hdel(self.REGISTRY_KEY, version_id)
+            self.redis.incr(self.EPOCH_KEY)
+            self.redis.publish(self.CHANGED_CHANNEL, version_id)
             
             # Remove from memory
             del self._versions[version_id]
             if version_id in self._models:
                 del self._models[version_id]
+            self._publish_snapshot()
         
         logger.info(f"Deleted model version: {version_id}")
     
     def _store_version(self, version: ModelVersion) -> None:
         """Store version metadata in Redis"""
+        # orjson emits bytes, which HSET takes directly
         self.redis.hset(
             self.REGISTRY_KEY,
             version.version_id,
-            json.dumps(version.to_dict()),
+            orjson.dumps(version.to_dict()),
         )
+        self.redis.incr(self.EPOCH_KEY)
+        self.redis.publish(self.CHANGED_CHANNEL, version.version_id)
     
     def _load_versions_from_redis(self) -> None:
-        """Load all version metadata from Redis"""
+        """Load all version metadata from Redis.
+
+        Checks the epoch counter first: if nothing has written to the
+        registry since the last load, the HGETALL and the re-parse of
+        every version's JSON are skipped entirely.
+        """
+        epoch = self.redis.get(self.EPOCH_KEY)
+        epoch = int(epoch) if epoch is not None else 0
+        if epoch == self._seen_epoch:
+            return
+
         versions = self.redis.hgetall(self.REGISTRY_KEY)
+        parsed = {}
         for version_id, data in versions.items():
             version_id = version_id.decode() if isinstance(version_id, bytes) else version_id
-            data = data.decode() if isinstance(data, bytes) else data
-            version = ModelVersion.from_dict(json.loads(data))
-            self._versions[version_id] = version
+            # orjson.loads takes bytes directly, no decode step
+            parsed[version_id] = ModelVersion.from_dict(orjson.loads(data))
+        with self._write_lock:
+            self._versions.update(parsed)
+            self._publish_snapshot()
+            self._seen_epoch = epoch
     
-    def _load_model(self, version: ModelVersion) -> BaseEstimator:
-        """Load a model from disk"""
+    def _load_model(self, version: ModelVersion) -> Any:
+        """Load a model from disk.
+
+        UBJSON files come back as a raw Booster; anything else falls back
+        to pickle. Loaded models are memoized in ``_models`` (and the
+        published snapshot), so each worker deserializes a version once.
+        """
+        if version.model_path.endswith(".ubj"):
+            booster = xgb.Booster()
+            booster.load_model(version.model_path)
+            return booster
         with open(version.model_path, "rb") as f:
             return pickle.load(f)
     
-    def _auto_reload_loop(self, interval: int) -> None:
-        """Background thread to reload versions from Redis"""
+    def _load_version_from_redis(self, version_id: str) -> None:
+        """Reload a single version after a change notification.
+
+        A missing hash field means the version was deleted on the
+        publishing worker, so it is dropped locally too.
+        """
+        data = self.redis.hget(self.REGISTRY_KEY, version_id)
+        with self._write_lock:
+            if data is None:
+                self._versions.pop(version_id, None)
+                self._models.pop(version_id, None)
+            else:
+                self._versions[version_id] = ModelVersion.from_dict(orjson.loads(data))
+            self._publish_snapshot()
+
+    def _pubsub_loop(self, heartbeat: int) -> None:
+        """Background thread reloading versions on change notifications.
+
+        Blocks on the pub/sub channel instead of polling, so changes
+        published by other workers become visible within milliseconds.
+        Waking every ``heartbeat`` seconds without a message triggers a
+        full reload as a safety net for missed messages; the epoch guard
+        keeps that to a single GET when nothing changed.
+        """
+        pubsub = None
         while True:
-            time.sleep(interval)
             try:
-                self._load_versions_from_redis()
+                if pubsub is None:
+                    pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe(self.CHANGED_CHANNEL)
+                message = pubsub.get_message(timeout=heartbeat)
+                if message is not None and message["type"] == "message":
+                    data = message["data"]
+                    version_id = data.decode() if isinstance(data, bytes) else data
+                    self._load_version_from_redis(version_id)
+                else:
+                    self._load_versions_from_redis()
             except Exception as e:
                 logger.error(f"Failed to reload versions: {e}")
+                pubsub = None
+                time.sleep(heartbeat)
 
 
 # Global registry instance
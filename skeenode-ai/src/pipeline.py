@@ -1,7 +1,6 @@
 import pandas as pd
 import numpy as np
 from xgboost import XGBClassifier
-import joblib
 import logging
 import os
 from typing import Optional
@@ -9,15 +8,19 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 class TrainingPipeline:
-    def __init__(self, model_path: str = "model.joblib"):
+    def __init__(self, model_path: str = "model.json"):
         self.model_path = model_path
         self.model: Optional[XGBClassifier] = None
+        self._booster = None
         self.load_model()
 
     def load_model(self):
         if os.path.exists(self.model_path):
             try:
-                self.model = joblib.load(self.model_path)
+                # Native JSON load: no pickle deserialization on cold start
+                self.model = XGBClassifier()
+                self.model.load_model(self.model_path)
+                self._booster = self.model.get_booster()
                 logger.info(f"Loaded model from {self.model_path}")
             except Exception as e:
                 logger.error(f"Failed to load model: {e}")
@@ -35,31 +38,50 @@ class TrainingPipeline:
             'job_type_len': np.random.randint(4, 10, n_samples)
         })
 
-        y = []
-        for _, row in X.iterrows():
-            prob = 0.1
-            if row['day_of_week'] >= 5: # Weekend
-                prob += 0.3
-            if row['hour'] < 6: # Late night
-                prob += 0.2
-            y.append(1 if np.random.random() < prob else 0)
+        # Vectorized label synthesis: boolean masks instead of an
+        # iterrows() loop that built a Series per row
+        prob = np.full(n_samples, 0.1)
+        prob += 0.3 * (X['day_of_week'].values >= 5)  # Weekend
+        prob += 0.2 * (X['hour'].values < 6)          # Late night
+        y = (np.random.random(n_samples) < prob).astype(np.int8)
 
         self.train(X, y)
 
-    def train(self, X: pd.DataFrame, y: list):
-        model = XGBClassifier(n_estimators=100, max_depth=3, eval_metric='logloss')
+    def train(self, X: pd.DataFrame, y: np.ndarray):
+        # int8 features: the values all fit (0-23 at most) and narrower
+        # split operands keep more of the tree in L1/L2 during inference
+        X = X.astype({
+            'day_of_week': 'int8',
+            'hour': 'int8',
+            'job_type_len': 'int8',
+        })
+        model = XGBClassifier(
+            n_estimators=100,
+            max_depth=3,
+            eval_metric='logloss',
+            tree_method='hist',
+            enable_categorical=True,
+        )
         model.fit(X, y)
         self.model = model
+        self._booster = model.get_booster()
 
-        # Persist
-        joblib.dump(self.model, self.model_path)
+        # Persist in xgboost's native JSON format (faster cold load than
+        # a joblib pickle)
+        self.model.save_model(self.model_path)
         logger.info(f"Model trained and saved to {self.model_path}")
 
-    def predict(self, features: pd.DataFrame) -> float:
+    def predict(self, features: pd.DataFrame) -> np.ndarray:
         if self.model is None:
             # Fallback if training failed or corrupted
-            return 0.0
-        return float(self.model.predict_proba(features)[0][1])
+            return np.zeros(len(features))
+        # Raw-Booster fast path: inplace_predict skips the pandas -> DMatrix
+        # conversion and the sklearn predict_proba dispatch per call.
+        # Vectorized over all rows: one booster call per batch instead of
+        # per-row DataFrame construction and dispatch
+        if isinstance(features, pd.DataFrame):
+            features = features.to_numpy(np.float32)
+        return self._booster.inplace_predict(features)
 
     def retrain(self):
         # In a real system, this would query a Feature Store or DB for fresh data.
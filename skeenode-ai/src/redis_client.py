@@ -0,0 +1,35 @@
+"""
+Shared Redis Connection Pool
+
+A single process-wide connection pool per Redis URL so the model
+registry, prediction cache, and training-status store reuse the same
+TCP connections instead of each opening their own pool.
+"""
+
+from typing import Dict, Optional
+
+import redis
+
+from .config import settings
+
+_pools: Dict[str, redis.ConnectionPool] = {}
+
+
+def get_redis_pool(redis_url: Optional[str] = None) -> redis.ConnectionPool:
+    """Get or create the shared connection pool for a Redis URL"""
+    url = redis_url or settings.redis_url
+    pool = _pools.get(url)
+    if pool is None:
+        pool = redis.ConnectionPool.from_url(
+            url,
+            max_connections=64,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+        _pools[url] = pool
+    return pool
+
+
+def get_redis_client(redis_url: Optional[str] = None) -> redis.Redis:
+    """Get a Redis client backed by the shared connection pool"""
+    return redis.Redis(connection_pool=get_redis_pool(redis_url))
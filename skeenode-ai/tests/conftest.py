@@ -2,6 +2,7 @@
 Pytest Configuration and Fixtures
 """
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
@@ -14,14 +15,46 @@ os.environ["RATE_LIMIT_ENABLED"] = "false"
 from src.app import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Compile pydantic schemas and import heavy modules once up front.
+
+    Importing src.app above already pulls most of the stack; touching
+    the rest here keeps first-import cost (core-schema builds, xgboost)
+    out of whichever test happens to run first.
+    """
+    import src.config  # noqa: F401
+    import src.model_registry  # noqa: F401
+    import src.schemas  # noqa: F401
+    import src.services.prediction  # noqa: F401
+
+
+@pytest.fixture(scope="session")
 def client():
-    """FastAPI test client"""
+    """FastAPI test client, shared across the session.
+
+    Entering TestClient runs the app's startup/shutdown lifespan (model
+    load, pydantic schema builds); session scope runs it exactly once
+    for the whole run instead of once per test or per module. No
+    current test mutates app state, so sharing is safe.
+    """
     with TestClient(app) as c:
         yield c
 
 
 @pytest.fixture
+def require_model(client):
+    """Skip the test when the service has no model loaded.
+
+    Happy-path prediction tests that would only exercise the 503 branch
+    skip up front instead of paying a full validation round-trip to
+    assert nothing.
+    """
+    if client.get("/ready").status_code != 200:
+        pytest.skip("model not loaded")
+
+
+@pytest.fixture(scope="session")
 def mock_features():
     """Sample job features for testing"""
     return {
@@ -34,7 +67,7 @@ def mock_features():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def prediction_request(mock_features):
     """Sample prediction request"""
     return {
@@ -42,3 +75,28 @@ def prediction_request(mock_features):
         "features": mock_features,
         "request_id": "req-001",
     }
+
+
+@pytest.fixture(scope="session")
+def over_limit_requests():
+    """101 prediction requests for batch-limit tests, built once.
+
+    model_construct skips validation and list multiply reuses one
+    instance; the batch size check only counts items, so distinct
+    validated objects would add cost without adding coverage.
+    """
+    from src.schemas import JobFeatures, PredictionRequest
+
+    features = JobFeatures(day_of_week=0, hour=12, job_type="SHELL")
+    one = PredictionRequest.model_construct(job_id="x", features=features)
+    return [one] * 101
+
+
+@pytest.fixture(scope="session")
+def prediction_request_bytes(prediction_request):
+    """Pre-encoded request body, shared by every test posting it.
+
+    Passing json= re-serializes the dict inside the client on each call;
+    encoding once with orjson and posting content= skips that.
+    """
+    return orjson.dumps(prediction_request)
@@ -2,8 +2,22 @@
 API Endpoint Tests
 """
 
+import asyncio
+
 import pytest
 from fastapi import status
+from httpx import ASGITransport, AsyncClient
+
+import orjson
+
+from fastapi import HTTPException
+
+from src.api.health import activate_model, rollback_model
+from src.app import app
+from src.model_registry import get_registry
+from src.schemas import ActivateModelRequest
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class TestHealthEndpoints:
@@ -60,27 +74,44 @@ class TestPredictionEndpoints:
         })
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     
-    def test_predict_with_valid_request(self, client, prediction_request):
-        """Test successful prediction (may fail if model not loaded)"""
-        response = client.post("/predict/failure", json=prediction_request)
-        
-        # Either succeeds with prediction or fails with 503 (no model)
-        if response.status_code == status.HTTP_200_OK:
-            data = response.json()
-            assert "job_id" in data
-            assert "failure_probability" in data
-            assert "decision" in data
-            assert 0 <= data["failure_probability"] <= 1
-            assert data["decision"] in ["PROCEED", "DELAY", "ABORT"]
-        else:
-            assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    def test_predict_with_valid_request(self, client, require_model, prediction_request_bytes):
+        """Test successful prediction (skips if model not loaded)"""
+        response = client.post(
+            "/predict/failure",
+            content=prediction_request_bytes,
+            headers=_JSON_HEADERS,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert "job_id" in data
+        assert "failure_probability" in data
+        assert "decision" in data
+        assert 0 <= data["failure_probability"] <= 1
+        assert data["decision"] in ["PROCEED", "DELAY", "ABORT"]
     
-    def test_batch_prediction_limit(self, client, prediction_request):
+    async def test_batch_prediction_limit(self, prediction_request):
         """Test batch endpoint respects max limit"""
-        # Create 101 requests (exceeds limit of 100)
-        requests = [prediction_request for _ in range(101)]
-        response = client.post("/predict/batch", json={"predictions": requests})
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        # Async client lets the boundary probes (100, 101, 200 items)
+        # run concurrently instead of three serial round-trips
+        bodies = [
+            orjson.dumps({"predictions": [prediction_request] * n})
+            for n in (100, 101, 200)
+        ]
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as ac:
+            at_limit, over, far_over = await asyncio.gather(*[
+                ac.post("/predict/batch", content=body, headers=_JSON_HEADERS)
+                for body in bodies
+            ])
+        assert over.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert far_over.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        # 100 items passes validation; may still 503 without a model
+        assert at_limit.status_code in [
+            status.HTTP_200_OK,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        ]
 
 
 class TestModelManagement:
@@ -94,15 +125,20 @@ class TestModelManagement:
         assert "models" in data
         assert isinstance(data["models"], list)
     
-    def test_activate_nonexistent_model(self, client):
+    async def test_activate_nonexistent_model(self):
         """Test activating non-existent model returns 404"""
-        response = client.post("/models/activate", json={
-            "version_id": "nonexistent-version-123",
-            "traffic_weight": 1.0,
-        })
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-    
-    def test_rollback_nonexistent_model(self, client):
+        # Only the 404 branch is under test, so call the handler
+        # directly instead of paying the ASGI/middleware round-trip
+        request = ActivateModelRequest(
+            version_id="nonexistent-version-123",
+            traffic_weight=1.0,
+        )
+        with pytest.raises(HTTPException) as exc_info:
+            await activate_model(request, get_registry())
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_rollback_nonexistent_model(self):
         """Test rollback to non-existent version returns 404"""
-        response = client.post("/models/rollback/nonexistent-version")
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        with pytest.raises(HTTPException) as exc_info:
+            await rollback_model("nonexistent-version", get_registry())
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
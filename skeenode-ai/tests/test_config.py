@@ -5,36 +5,46 @@ Unit Tests for Configuration
 import os
 import pytest
 
+from src.config import get_settings
+
 
 class TestConfig:
     """Test configuration loading"""
-    
+
     def test_default_values(self):
         """Test default configuration values"""
-        # Import with fresh environment
-        from src.config import Settings
-        
-        settings = Settings()
+        # Cached factory: the Settings schema and env parsing run once
+        # per process instead of per test
+        settings = get_settings()
         assert settings.service_name == "skeenode-ai"
         assert settings.port == 8000
         assert settings.log_level == "INFO"
-    
+
     def test_environment_override(self, monkeypatch):
         """Test environment variables override defaults"""
         monkeypatch.setenv("PORT", "9000")
         monkeypatch.setenv("LOG_LEVEL", "DEBUG")
-        
-        from src.config import Settings
-        settings = Settings()
-        
-        assert settings.port == 9000
-        assert settings.log_level == "DEBUG"
-    
-    def test_rate_limit_defaults(self):
+
+        # Drop the cached instance so the patched env is re-read, and
+        # again afterwards so later tests don't see the override
+        get_settings.cache_clear()
+        try:
+            settings = get_settings()
+            assert settings.port == 9000
+            assert settings.log_level == "DEBUG"
+        finally:
+            get_settings.cache_clear()
+
+    def test_rate_limit_defaults(self, monkeypatch):
         """Test rate limiting defaults"""
-        from src.config import Settings
-        
-        settings = Settings()
-        assert settings.rate_limit_enabled is True
-        assert settings.rate_limit_requests == 100
-        assert settings.rate_limit_window == 60
+        # conftest pins RATE_LIMIT_ENABLED=false for the session; drop
+        # it (and the cached instance) so the real defaults are under test
+        monkeypatch.delenv("RATE_LIMIT_ENABLED", raising=False)
+        get_settings.cache_clear()
+        try:
+            settings = get_settings()
+            assert settings.rate_limit_enabled is True
+            assert settings.rate_limit_requests == 100
+            assert settings.rate_limit_window == 60
+        finally:
+            get_settings.cache_clear()